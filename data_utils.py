@@ -3,16 +3,32 @@ Utility functions for data processing and cleaning.
 This module contains various helper functions for data manipulation and standardization.
 """
 
+import io
 import re
+import sys
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
-from typing import List, Dict, Any, Tuple
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from typing import List, Dict, Any, Optional, Tuple
 import warnings
 
+try:
+    import polars as pl
+    _HAS_POLARS = True
+except ImportError:
+    _HAS_POLARS = False
 
-def standardize_column_names(df: pd.DataFrame, prefix: str = 'col') -> pd.DataFrame:
+
+# Patterns used to clean column names
+_NON_ALNUM = re.compile(r'[^a-z0-9]')
+_DUP_UNDER = re.compile(r'_+')
+_STANDARD_NAME = re.compile(r'[a-z][a-z0-9]*(?:_[a-z0-9]+)*')
+
+
+def standardize_column_names(df: pd.DataFrame, prefix: str = 'col', verbose: bool = True) -> pd.DataFrame:
     """
     Standardize column names in a DataFrame.
     
@@ -22,6 +38,8 @@ def standardize_column_names(df: pd.DataFrame, prefix: str = 'col') -> pd.DataFr
         The input DataFrame whose columns need to be standardized
     prefix : str, optional (default='col')
         Prefix to add to column names that start with numbers
+    verbose : bool, optional (default=True)
+        Whether to print the column name changes
         
     Returns:
     --------
@@ -35,50 +53,77 @@ def standardize_column_names(df: pd.DataFrame, prefix: str = 'col') -> pd.DataFr
     >>> print(df_clean.columns.tolist())
     ['first_name', 'col_2nd_address']
     """
-    def clean_column_name(col_name: str) -> str:
-        # Convert to string and lowercase
-        name = str(col_name).lower().strip()
-        
-        # Replace special characters and spaces with underscore
-        name = re.sub(r'[^a-z0-9]', '_', name)
-        
-        # Remove duplicate underscores
-        name = re.sub(r'_+', '_', name)
-        
-        # Remove leading and trailing underscores
-        name = name.strip('_')
-        
-        # Ensure the name starts with a letter
-        if not name[0].isalpha():
-            name = f"{prefix}_{name}"
-            
-        return name
+    # Return the DataFrame unchanged if its column names are already standardized
+    cols = df.columns
+    if cols.is_unique and all(isinstance(col, str) and _STANDARD_NAME.fullmatch(col) for col in cols):
+        if verbose:
+            sys.stdout.write("Column name changes:\n")
+        return df
     
-    # Create a dictionary of old and new column names
-    new_columns = {col: clean_column_name(col) for col in df.columns}
+    # Convert to string and lowercase
+    names = df.columns.map(str).str.lower().str.strip()
+    
+    # Replace special characters and spaces with underscore, remove duplicate
+    # underscores and strip leading and trailing underscores
+    names = (
+        names.str.replace(_NON_ALNUM, '_', regex=True)
+        .str.replace(_DUP_UNDER, '_', regex=True)
+        .str.strip('_')
+    )
+    
+    # Ensure the name starts with a letter
+    needs_prefix = ~names.str.match(r'[a-z]')
+    names = names.where(~needs_prefix, prefix + '_' + names)
     
     # Handle duplicate column names by adding a suffix
-    seen = {}
-    for old_col, new_col in new_columns.items():
-        if new_col in seen:
-            counter = seen[new_col]
-            seen[new_col] += 1
-            new_columns[old_col] = f"{new_col}_{counter}"
-        else:
-            seen[new_col] = 1
-    
-    # Create a new DataFrame with standardized column names
-    df_standardized = df.rename(columns=new_columns)
-    
-    # Print the changes made
-    print("Column name changes:")
-    for old, new in new_columns.items():
-        if old != new:
-            print(f"{old:30} -> {new}")
+    names = pd.Series(names)
+    counter = names.groupby(names, sort=False).cumcount()
+    names = names.where(counter == 0, names + '_' + counter.astype(str))
+    
+    # Create a new DataFrame with standardized column names, sharing the data
+    # with the input instead of reindexing it through rename
+    df_standardized = df.copy(deep=False)
+    df_standardized.columns = pd.Index(names)
+    
+    # Print the changes made in a single write
+    if verbose:
+        changes = [f"{old:30} -> {new}\n" for old, new in zip(df.columns, names) if old != new]
+        sys.stdout.write("Column name changes:\n" + "".join(changes))
     
     return df_standardized
     
 
+def _to_polars(df: pd.DataFrame) -> Optional['pl.DataFrame']:
+    """
+    Convert a numeric DataFrame to polars for the multithreaded aggregation
+    paths.
+    
+    Parameters:
+    -----------
+    df : pandas.DataFrame
+        The input DataFrame to convert
+        
+    Returns:
+    --------
+    Optional[polars.DataFrame]
+        The converted DataFrame, or None if polars is not installed or the
+        DataFrame cannot be represented in polars
+    """
+    if not _HAS_POLARS:
+        return None
+    
+    # Polars requires unique string column names
+    if not df.columns.is_unique or not all(isinstance(col, str) for col in df.columns):
+        return None
+    
+    # Arrow and polars raise a range of exception types for unsupported
+    # columns, so any conversion failure falls back to pandas
+    try:
+        return pl.from_pandas(df)
+    except Exception:
+        return None
+
+
 def analyze_missing_values(df: pd.DataFrame) -> pd.DataFrame:
     """
     Analyze missing values in the DataFrame.
@@ -94,9 +139,11 @@ def analyze_missing_values(df: pd.DataFrame) -> pd.DataFrame:
         DataFrame with missing value statistics
     """
     # Calculate missing value statistics
+    mask = df.isna().to_numpy()
+    missing_count = pd.Series(np.count_nonzero(mask, axis=0), index=df.columns)
     missing_stats = pd.DataFrame({
-        'missing_count': df.isnull().sum(),
-        'missing_percentage': (df.isnull().sum() / len(df)) * 100,
+        'missing_count': missing_count,
+        'missing_percentage': missing_count.mul(100.0 / len(df) if len(df) else np.nan),
         'dtype': df.dtypes
     })
     
@@ -106,7 +153,76 @@ def analyze_missing_values(df: pd.DataFrame) -> pd.DataFrame:
     return missing_stats
 
 
-def analyze_numeric_columns(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, plt.Figure]]:
+def _render_png(fig: Figure) -> bytes:
+    """
+    Render a figure to PNG bytes without registering it with pyplot.
+    
+    Parameters:
+    -----------
+    fig : matplotlib.figure.Figure
+        The figure to render
+        
+    Returns:
+    --------
+    bytes
+        PNG image data
+    """
+    buf = io.BytesIO()
+    FigureCanvasAgg(fig).print_png(buf)
+    return buf.getvalue()
+
+
+def _describe_polars(pl_df: 'pl.DataFrame') -> pd.DataFrame:
+    """
+    Calculate describe() statistics plus skew and kurtosis with polars.
+    
+    Parameters:
+    -----------
+    pl_df : polars.DataFrame
+        DataFrame with numeric columns only
+        
+    Returns:
+    --------
+    pandas.DataFrame
+        Statistics laid out as in pandas.DataFrame.describe()
+    """
+    col = pl.all()
+    aggregations = {
+        'count': col.count(),
+        'mean': col.mean(),
+        'std': col.std(),
+        'min': col.min(),
+        '25%': col.quantile(0.25, interpolation='linear'),
+        '50%': col.quantile(0.5, interpolation='linear'),
+        '75%': col.quantile(0.75, interpolation='linear'),
+        'max': col.max(),
+        'skew': col.skew(bias=False),
+        'kurtosis': col.kurtosis(bias=False),
+    }
+    
+    # Compute every statistic in a single select
+    row = pl_df.select([
+        expr.cast(pl.Float64).name.suffix(f'__{i}')
+        for i, expr in enumerate(aggregations.values())
+    ]).row(0)
+    values = np.array(row, dtype=np.float64).reshape(len(aggregations), pl_df.width)
+    stats = pd.DataFrame(values, index=list(aggregations), columns=pl_df.columns)
+    
+    # Match pandas, which reports zero skew and kurtosis for constant columns
+    # and treats a sum of squared deviations below its floating point error
+    # bound as zero
+    count = stats.loc['count']
+    m2 = stats.loc['std'] ** 2 * (count - 1)
+    max_abs = np.maximum(stats.loc['min'].abs(), stats.loc['max'].abs())
+    tolerance = (np.finfo(np.float64).eps * max_abs) ** 2 * count
+    constant = m2.eq(0) | m2.lt(tolerance)
+    stats.loc['skew', constant & count.ge(3)] = 0.0
+    stats.loc['kurtosis', constant & count.ge(4)] = 0.0
+    
+    return stats
+
+
+def analyze_numeric_columns(df: pd.DataFrame, make_plots: bool = True) -> Tuple[pd.DataFrame, Dict[str, bytes]]:
     """
     Analyze numeric columns in the DataFrame.
     
@@ -114,24 +230,36 @@ def analyze_numeric_columns(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, p
     -----------
     df : pandas.DataFrame
         The input DataFrame to analyze
+    make_plots : bool, optional (default=True)
+        Whether to render the distribution plots
         
     Returns:
     --------
-    Tuple[pandas.DataFrame, Dict[str, plt.Figure]]
-        DataFrame with numeric statistics and dictionary of distribution plots
+    Tuple[pandas.DataFrame, Dict[str, bytes]]
+        DataFrame with numeric statistics and dictionary of distribution
+        plots rendered as PNG images (empty if make_plots is False)
     """
     # Select numeric columns
-    numeric_cols = df.select_dtypes(include=['int64', 'float64']).columns
+    num = df.select_dtypes(include=np.number, exclude=np.complexfloating)
+    numeric_cols = num.columns
     
     # Calculate statistics
-    stats = df[numeric_cols].describe()
-    stats.loc['skew'] = df[numeric_cols].skew()
-    stats.loc['kurtosis'] = df[numeric_cols].kurtosis()
+    pl_num = _to_polars(num) if len(numeric_cols) else None
+    if pl_num is not None:
+        stats = _describe_polars(pl_num)
+    else:
+        stats = num.describe()
+        stats.loc['skew'] = num.skew(numeric_only=True)
+        stats.loc['kurtosis'] = num.kurtosis(numeric_only=True)
+    
+    if not make_plots:
+        return stats, {}
     
     # Create distribution plots
     plots = {}
     for col in numeric_cols:
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 5))
+        fig = Figure(figsize=(15, 5))
+        ax1, ax2 = fig.subplots(1, 2)
         
         # Histogram
         sns.histplot(data=df, x=col, ax=ax1)
@@ -141,13 +269,12 @@ def analyze_numeric_columns(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, p
         sns.boxplot(data=df, y=col, ax=ax2)
         ax2.set_title(f'Box Plot of {col}')
         
-        plots[col] = fig
-        plt.close(fig)
+        plots[col] = _render_png(fig)
     
     return stats, plots
 
 
-def analyze_categorical_columns(df: pd.DataFrame, max_categories: int = 20) -> Tuple[Dict[str, pd.Series], Dict[str, plt.Figure]]:
+def analyze_categorical_columns(df: pd.DataFrame, max_categories: int = 20, make_plots: bool = True) -> Tuple[Dict[str, pd.Series], Dict[str, bytes]]:
     """
     Analyze categorical columns in the DataFrame.
     
@@ -157,11 +284,14 @@ def analyze_categorical_columns(df: pd.DataFrame, max_categories: int = 20) -> T
         The input DataFrame to analyze
     max_categories : int, optional (default=20)
         Maximum number of categories to display in plots
+    make_plots : bool, optional (default=True)
+        Whether to render the bar plots
         
     Returns:
     --------
-    Tuple[Dict[str, pd.Series], Dict[str, plt.Figure]]
-        Dictionary of value counts and dictionary of bar plots
+    Tuple[Dict[str, pd.Series], Dict[str, bytes]]
+        Dictionary of value counts and dictionary of bar plots rendered as
+        PNG images (empty if make_plots is False)
     """
     # Select categorical and boolean columns
     cat_cols = df.select_dtypes(include=['object', 'category', 'bool']).columns
@@ -174,28 +304,30 @@ def analyze_categorical_columns(df: pd.DataFrame, max_categories: int = 20) -> T
         vc = df[col].value_counts()
         value_counts[col] = vc
         
+        if not make_plots:
+            continue
+        
         # Create bar plot
-        fig, ax = plt.subplots(figsize=(12, 6))
+        fig = Figure(figsize=(12, 6))
+        ax = fig.subplots()
         
+        labels = vc.index.to_numpy(dtype=object)
+        counts = vc.to_numpy()
         if len(vc) > max_categories:
             # Show top categories and group others
-            top_categories = vc.nlargest(max_categories)
-            others = pd.Series({'Others': vc[max_categories:].sum()})
-            vc_plot = pd.concat([top_categories, others])
-        else:
-            vc_plot = vc
+            labels = np.append(labels[:max_categories], 'Others')
+            counts = np.append(counts[:max_categories], counts[max_categories:].sum())
             
-        sns.barplot(x=vc_plot.index, y=vc_plot.values, ax=ax)
+        sns.barplot(x=labels, y=counts, ax=ax)
         ax.set_title(f'Distribution of {col}')
         ax.set_xticklabels(ax.get_xticklabels(), rotation=45, ha='right')
         
-        plots[col] = fig
-        plt.close(fig)
+        plots[col] = _render_png(fig)
     
     return value_counts, plots
 
 
-def analyze_correlations(df: pd.DataFrame) -> Tuple[pd.DataFrame, plt.Figure]:
+def analyze_correlations(df: pd.DataFrame, make_plots: bool = True) -> Tuple[pd.DataFrame, Optional[plt.Figure]]:
     """
     Analyze correlations between numeric columns.
     
@@ -203,21 +335,34 @@ def analyze_correlations(df: pd.DataFrame) -> Tuple[pd.DataFrame, plt.Figure]:
     -----------
     df : pandas.DataFrame
         The input DataFrame to analyze
+    make_plots : bool, optional (default=True)
+        Whether to render the heatmap
         
     Returns:
     --------
-    Tuple[pandas.DataFrame, plt.Figure]
-        Correlation matrix and heatmap plot
+    Tuple[pandas.DataFrame, Optional[plt.Figure]]
+        Correlation matrix and heatmap plot (None if make_plots is False)
     """
     # Select numeric columns
-    numeric_cols = df.select_dtypes(include=['int64', 'float64']).columns
+    num = df.select_dtypes(include=np.number, exclude=np.complexfloating)
+    arr = num.to_numpy(dtype=np.float64, na_value=np.nan)
+    
+    # Calculate correlations, with a single BLAS pass when there are no NaNs
+    if arr.shape[0] > 1 and arr.shape[1] > 0 and not np.isnan(arr).any():
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = np.atleast_2d(np.corrcoef(arr, rowvar=False))
+        corr_matrix = pd.DataFrame(corr, index=num.columns, columns=num.columns)
+    else:
+        corr_matrix = num.corr()
     
-    # Calculate correlations
-    corr_matrix = df[numeric_cols].corr()
+    if not make_plots:
+        return corr_matrix, None
     
-    # Create correlation heatmap
+    # Create correlation heatmap, drawing only the lower triangle since the
+    # matrix is symmetric
+    mask = np.triu(np.ones(corr_matrix.shape, dtype=bool), k=1)
     fig, ax = plt.subplots(figsize=(12, 10))
-    sns.heatmap(corr_matrix, annot=True, cmap='coolwarm', center=0, ax=ax)
+    sns.heatmap(corr_matrix.astype(np.float32), annot=True, cmap='coolwarm', center=0, mask=mask, ax=ax)
     ax.set_title('Correlation Matrix')
     
     return corr_matrix, fig
@@ -239,24 +384,21 @@ def detect_outliers(df: pd.DataFrame, threshold: float = 1.5) -> Dict[str, pd.Se
     Dict[str, pd.Series]
         Dictionary with outlier indices for each numeric column
     """
-    numeric_cols = df.select_dtypes(include=['int64', 'float64']).columns
-    outliers = {}
+    num = df.select_dtypes(include=np.number, exclude=np.complexfloating)
     
-    for col in numeric_cols:
-        # Calculate IQR
-        Q1 = df[col].quantile(0.25)
-        Q3 = df[col].quantile(0.75)
-        IQR = Q3 - Q1
-        
-        # Define outlier bounds
-        lower_bound = Q1 - threshold * IQR
-        upper_bound = Q3 + threshold * IQR
-        
-        # Find outliers
-        outliers[col] = df[
-            (df[col] < lower_bound) | 
-            (df[col] > upper_bound)
-        ][col]
+    # Calculate IQR for all numeric columns at once
+    quartiles = num.quantile([0.25, 0.75])
+    Q1 = quartiles.loc[0.25]
+    Q3 = quartiles.loc[0.75]
+    IQR = Q3 - Q1
+    
+    # Define outlier bounds
+    lower_bound = Q1 - threshold * IQR
+    upper_bound = Q3 + threshold * IQR
+    
+    # Find outliers
+    mask = num.lt(lower_bound) | num.gt(upper_bound)
+    outliers = {col: num[col][mask[col]] for col in num.columns}
     
     return outliers
 
@@ -282,11 +424,12 @@ def generate_summary_report(df: pd.DataFrame) -> str:
     report.append(f"Number of rows: {len(df)}")
     report.append(f"Number of columns: {len(df.columns)}")
     
-    # Column types
-    type_counts = df.dtypes.value_counts()
+    # Column types, most frequent first
+    groups = df.columns.groupby(df.dtypes)
+    groups = sorted(groups.items(), key=lambda item: len(item[1]), reverse=True)
     report.append("\n=== COLUMN TYPES ===")
-    for dtype, count in type_counts.items():
-        report.append(f"{dtype}: {count} columns")
+    for dtype, cols in groups:
+        report.append(f"{dtype}: {len(cols)} columns")
     
     # Memory usage
     memory_usage = df.memory_usage(deep=True).sum() / 1024**2  # Convert to MB
@@ -294,8 +437,7 @@ def generate_summary_report(df: pd.DataFrame) -> str:
     
     # Sample of column names by type
     report.append("\n=== COLUMNS BY TYPE ===")
-    for dtype in type_counts.index:
-        cols = df.select_dtypes(include=[dtype]).columns
+    for dtype, cols in groups:
         report.append(f"\n{dtype}:")
         report.append(", ".join(cols[:5]))
         if len(cols) > 5: